@@ -0,0 +1,94 @@
+r"""
+Algebraic kernels for the adsorption models in :mod:`callapy.model`.
+
+Each kernel is a free function of the measured inputs that returns
+(:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`).
+The kernels accept either plain floats (one data point at a time)
+or :class:`numpy.ndarray` inputs, in which case the expressions
+broadcast as NumPy ufuncs.
+
+When :mod:`numba` is installed the kernels are compiled with
+:func:`numba.njit`, which removes the Python-level call overhead and
+all intermediate temporaries for per-point workloads. :mod:`numba` is
+an optional dependency; without it the kernels run as plain Python
+functions and the array path is still fully vectorized.
+"""
+import typing
+
+try:
+    import numba
+
+    def _jit(func: typing.Callable) -> typing.Callable:
+        return numba.njit(fastmath=True, cache=True)(func)
+except ImportError:
+    def _jit(func: typing.Callable) -> typing.Callable:
+        return func
+
+
+@_jit
+def eval_XS_kernel(V_in, d_in, d_eq, CA_in, CA_eq, inv_m):
+    r"""Excess adsorption model (XS), Equations :eq:`XS_QA` and :eq:`XS_QS`
+
+    The reciprocals of the divisors (here ``inv_m`` :math:`=1/m`) are taken as
+    inputs so a caller holding many data points pays for each division once
+    instead of on every evaluation.
+
+    :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
+    """
+    dC = CA_in - CA_eq
+    Q_A = V_in * dC * inv_m
+    Q_S = V_in * ((d_in - d_eq) - dC) * inv_m
+    return Q_A, Q_S, V_in
+
+
+@_jit
+def eval_NS_kernel(V_in, d_in, d_eq, m, CA_in, CA_eq, inv_m, inv_CAeq, Vin_CAin):
+    r"""No-solvent adsorption model (NS), Equations :eq:`NS_QA` and :eq:`NS_QS`
+
+    Equation :eq:`NS_QA` is evaluated with numerator and denominator scaled
+    by :math:`C_\text{A,eq}`, so the denominator is the direct difference
+    :math:`C_\text{A,eq}-\rho_\text{eq}` of similarly-scaled operands rather
+    than :math:`1-\rho_\text{eq}/C_\text{A,eq}`, which cancels
+    catastrophically when the two are close. The stable form stays accurate
+    in float32.
+
+    :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
+    """
+    Q_A = V_in * (d_in * CA_eq - CA_in * d_eq) / (CA_eq - d_eq) * inv_m
+    V_eq = (Vin_CAin - m * Q_A) * inv_CAeq
+    Q_S = 0.0 * Q_A
+    return Q_A, Q_S, V_eq
+
+
+@_jit
+def eval_VC_kernel(V_in, d_in, d_eq, m, CA_in, CA_eq, inv_m, inv_dA):
+    r"""Volume change by solute adsorption model (VC), Equations :eq:`VC_QA` and :eq:`VC_QS`
+
+    :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
+    """
+    Q_A = V_in * (CA_in - CA_eq) / (1.0 - CA_eq * inv_dA) * inv_m
+    V_eq = V_in - m * Q_A * inv_dA
+    Q_S = (V_in * d_in - V_eq * d_eq - m * Q_A) * inv_m
+    return Q_A, Q_S, V_eq
+
+
+@_jit
+def eval_PF_kernel(V_in, d_in, d_eq, m, CA_in, CA_eq, d_A, d_S, V_p, inv_CAeq, inv_dA, Vin_CAin):
+    r"""Pore-filling adsorption model (PF), Equations :eq:`PF_QA` and :eq:`PF_QS`
+
+    Equation :eq:`PF_QA` is evaluated with numerator and denominator scaled
+    by :math:`C_\text{A,eq}\rho_\text{A}`, so the denominator subtracts
+    similarly-scaled products instead of the ratios
+    :math:`\rho_\text{eq}/C_\text{A,eq}` and :math:`\rho_\text{S}/\rho_\text{A}`
+    from 1, which cancels catastrophically when
+    :math:`\rho_\text{eq}\approx C_\text{A,eq}`. The stable form stays
+    accurate in float32.
+
+    :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
+    """
+    num = (V_in * (d_in * CA_eq - CA_in * d_eq) - m * d_S * V_p * CA_eq) * d_A
+    den = m * ((CA_eq - d_eq) * d_A - d_S * CA_eq)
+    Q_A = num / den
+    Q_S = (V_p - Q_A * inv_dA) * d_S
+    V_eq = (Vin_CAin - m * Q_A) * inv_CAeq
+    return Q_A, Q_S, V_eq
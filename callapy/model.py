@@ -156,13 +156,277 @@ while the solvent loading can be calculated as
 """
 
 
+import functools
+import types
 import typing
 import numpy as np
-import uncertainties as u
+from callapy import kernels
+try:
+    from callapy import _model_kernel
+except ImportError:
+    _model_kernel = None
 input_data = typing.Union[float, typing.List, typing.Tuple, typing.Generator, np.array]
 error_data = typing.Union[float, typing.List, typing.Tuple, typing.Generator, np.array, None]
 
 
+def _as_float_array(value: input_data, dtype: np.dtype = np.float64, xp=np) -> np.ndarray:
+    r"""Convert input data to a contiguous 1-D array of floats
+
+    Scalars become length-1 arrays so that every :class:`.Model` calculation
+    broadcasts over the whole dataset at once as ufuncs.
+
+    :param value: input data as scalar, list, tuple, generator, or array
+    :param dtype: floating-point type of the returned array, defaults to np.float64
+    :param xp: array module providing the returned array type, defaults to :mod:`numpy`
+    :return: input data as 1-D array of floats
+    """
+    if isinstance(value, types.GeneratorType):
+        value = np.fromiter(value, dtype=dtype)
+    return xp.atleast_1d(xp.asarray(value, dtype=dtype))
+
+
+_DEFAULT_SIG_FIGS = 3
+
+
+def _last_decimal_error(values: np.ndarray) -> np.ndarray:
+    r"""Estimate measurement error as one unit in the last reported digit
+
+    Used when no explicit error is given: each value is assumed to carry
+    :data:`_DEFAULT_SIG_FIGS` significant digits past the leading one, so
+    the error is one unit of the last digit.
+
+    :param values: measured input data
+    :return: estimated error of each value
+    """
+    # zeros are replaced by one before the log (giving them magnitude 0)
+    # with plain ufuncs: cupy's ufuncs do not accept the where= argument
+    magnitude = np.floor(np.log10(np.abs(values) + (values == 0.0)))
+    return 10.0 ** (magnitude - _DEFAULT_SIG_FIGS)
+
+
+def _as_optional_float_array(value: error_data, dtype: np.dtype = np.float64,
+                             xp=np) -> typing.Optional[np.ndarray]:
+    r"""Convert error data to a 1-D array of floats, passing through None
+
+    :param value: error data as scalar, list, tuple, generator, array, or None
+    :param dtype: floating-point type of the returned array, defaults to np.float64
+    :param xp: array module providing the returned array type, defaults to :mod:`numpy`
+    :return: error data as 1-D array of floats, or None
+    """
+    if value is None:
+        return None
+    return _as_float_array(value, dtype=dtype, xp=xp)
+
+
+def _array_module(backend: str):
+    r"""Resolve a backend name to the array module implementing it
+
+    The model arithmetic is elementwise with no dependencies between data
+    points, so it maps unchanged onto :mod:`cupy`, whose ufuncs run as CUDA
+    kernels with far higher memory bandwidth than host DRAM. :mod:`cupy` is
+    an optional dependency and only imported when requested.
+
+    :param backend: 'numpy' (default, host arrays) or 'cupy' (GPU arrays)
+    :return: the array module for *backend*
+    """
+    if backend == 'numpy':
+        return np
+    if backend == 'cupy':
+        try:
+            import cupy
+        except ImportError:
+            raise ImportError("backend='cupy' requires the cupy package")
+        return cupy
+    raise ValueError("backend must be 'numpy' or 'cupy', got %r" % (backend,))
+
+
+def _raw_kernel(kernel: typing.Callable) -> typing.Callable:
+    r"""The uncompiled Python function underneath a :mod:`callapy.kernels` kernel
+
+    :mod:`numba`-compiled kernels only accept host arrays; the cupy backend
+    calls the plain function instead, so each ufunc in the kernel body
+    dispatches to a CUDA kernel.
+
+    :param kernel: possibly numba-compiled kernel function
+    :return: the plain-Python function
+    """
+    return getattr(kernel, 'py_func', kernel)
+
+
+class DataPoint:
+    r"""A single batch-adsorption experiment
+
+    Stores the measured quantities for one data point as plain floats.
+    Data points are immutable and hashable, so repeated evaluations of the
+    same point are served from a :func:`functools.lru_cache` instead of
+    redoing the arithmetic (see :meth:`.DataPoint.eval_XS` and friends).
+    Collections of data points are best evaluated through
+    :class:`.DataPointBatch`, which stores each field contiguously so the
+    models run as vectorized array expressions instead of per-point loops.
+
+    :param V_in: initial volume, :math:`V_\text{in}`
+    :type V_in: float
+    :param d_in: initial density, :math:`\rho_\text{in}`
+    :type d_in: float
+    :param d_eq: equilibrium density, :math:`\rho_\text{eq}`
+    :type d_eq: float
+    :param m: mass of zeolite, :math:`m`
+    :type m: float
+    :param CA_in: initial concentration of solute A, :math:`C_\text{A,in}`
+    :type CA_in: float
+    :param CA_eq: equilibrium concentration of solute A, :math:`C_\text{A,eq}`
+    :type CA_eq: float
+    :param d_A: estimated density of adsorbate, defaults to None
+    :type d_A: float, optional
+    :param d_S: estimated density of solvent in pores, defaults to None
+    :type d_S: float, optional
+    :param V_p: estimated pore volume within solid, defaults to None
+    :type V_p: float, optional
+    """
+
+    __slots__ = ('V_in', 'd_in', 'd_eq', 'm', 'CA_in', 'CA_eq', 'd_A', 'd_S', 'V_p')
+
+    def __init__(self, V_in, d_in, d_eq, m, CA_in, CA_eq, d_A=None, d_S=None, V_p=None):
+        object.__setattr__(self, 'V_in', float(V_in))
+        object.__setattr__(self, 'd_in', float(d_in))
+        object.__setattr__(self, 'd_eq', float(d_eq))
+        object.__setattr__(self, 'm', float(m))
+        object.__setattr__(self, 'CA_in', float(CA_in))
+        object.__setattr__(self, 'CA_eq', float(CA_eq))
+        object.__setattr__(self, 'd_A', None if d_A is None else float(d_A))
+        object.__setattr__(self, 'd_S', None if d_S is None else float(d_S))
+        object.__setattr__(self, 'V_p', None if V_p is None else float(V_p))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('DataPoint is immutable; construct a new point instead')
+
+    def _astuple(self) -> typing.Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DataPoint):
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __hash__(self) -> int:
+        return hash(self._astuple())
+
+    def eval_XS(self) -> typing.Tuple:
+        r"""Excess adsorption model (XS) for this data point, memoized
+
+        :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
+        """
+        return _eval_XS_cached(self.V_in, self.d_in, self.d_eq, self.CA_in, self.CA_eq, 1.0 / self.m)
+
+    def eval_NS(self) -> typing.Tuple:
+        r"""No-solvent adsorption model (NS) for this data point, memoized
+
+        :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
+        """
+        return _eval_NS_cached(self.V_in, self.d_in, self.d_eq, self.m, self.CA_in, self.CA_eq,
+                               1.0 / self.m, 1.0 / self.CA_eq, self.V_in * self.CA_in)
+
+    def eval_VC(self) -> typing.Tuple:
+        r"""Volume change by solute adsorption model (VC) for this data point, memoized
+
+        :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
+        """
+        assert self.d_A is not None, 'Adsorbed density needed for VC method'
+        return _eval_VC_cached(self.V_in, self.d_in, self.d_eq, self.m, self.CA_in, self.CA_eq,
+                               1.0 / self.m, 1.0 / self.d_A)
+
+    def eval_PF(self) -> typing.Tuple:
+        r"""Pore-filling adsorption model (PF) for this data point, memoized
+
+        :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
+        """
+        assert self.d_A is not None, 'Adsorbed density needed for PC'
+        assert self.V_p is not None, 'Pore volume needed for PF method'
+        assert self.d_S is not None, 'Adsorbed density needed for VC method'
+        return _eval_PF_cached(self.V_in, self.d_in, self.d_eq, self.m, self.CA_in, self.CA_eq,
+                               self.d_A, self.d_S, self.V_p, 1.0 / self.CA_eq, 1.0 / self.d_A,
+                               self.V_in * self.CA_in)
+
+
+_eval_XS_cached = functools.lru_cache(maxsize=256)(kernels.eval_XS_kernel)
+_eval_NS_cached = functools.lru_cache(maxsize=256)(kernels.eval_NS_kernel)
+_eval_VC_cached = functools.lru_cache(maxsize=256)(kernels.eval_VC_kernel)
+_eval_PF_cached = functools.lru_cache(maxsize=256)(kernels.eval_PF_kernel)
+
+
+class DataPointBatch:
+    r"""A structure-of-arrays collection of :class:`.DataPoint`
+
+    Each field is held as one contiguous :class:`numpy.ndarray` of length N
+    rather than scattered across N :class:`.DataPoint` instances, so the
+    models stream through the dataset as cache-friendly vector operations.
+
+    :param V_in: initial volumes, :math:`V_\text{in}`
+    :type V_in: np.ndarray
+    :param d_in: initial densities, :math:`\rho_\text{in}`
+    :type d_in: np.ndarray
+    :param d_eq: equilibrium densities, :math:`\rho_\text{eq}`
+    :type d_eq: np.ndarray
+    :param m: masses of zeolite, :math:`m`
+    :type m: np.ndarray
+    :param CA_in: initial concentrations of solute A, :math:`C_\text{A,in}`
+    :type CA_in: np.ndarray
+    :param CA_eq: equilibrium concentrations of solute A, :math:`C_\text{A,eq}`
+    :type CA_eq: np.ndarray
+    :param d_A: estimated densities of adsorbate, defaults to None
+    :type d_A: np.ndarray, optional
+    :param d_S: estimated densities of solvent in pores, defaults to None
+    :type d_S: np.ndarray, optional
+    :param V_p: estimated pore volumes within solid, defaults to None
+    :type V_p: np.ndarray, optional
+    """
+
+    fields = ('V_in', 'd_in', 'd_eq', 'm', 'CA_in', 'CA_eq')
+    optional_fields = ('d_A', 'd_S', 'V_p')
+
+    def __init__(self, V_in, d_in, d_eq, m, CA_in, CA_eq, d_A=None, d_S=None, V_p=None):
+        self.V_in = _as_float_array(V_in)
+        self.d_in = _as_float_array(d_in)
+        self.d_eq = _as_float_array(d_eq)
+        self.m = _as_float_array(m)
+        self.CA_in = _as_float_array(CA_in)
+        self.CA_eq = _as_float_array(CA_eq)
+        self.d_A = _as_optional_float_array(d_A)
+        self.d_S = _as_optional_float_array(d_S)
+        self.V_p = _as_optional_float_array(V_p)
+
+    @classmethod
+    def from_points(cls, points: typing.Iterable) -> 'DataPointBatch':
+        r"""Unpack an iterable of :class:`.DataPoint` into contiguous arrays
+
+        The optional fields (d_A, d_S, V_p) are collected only when present
+        on every point; otherwise they are left as None.
+
+        :param points: data points to collect
+        :return: batch holding one contiguous array per field
+        """
+        points = list(points)
+        count = len(points)
+
+        def column(name):
+            return np.fromiter((getattr(point, name) for point in points), dtype=np.float64, count=count)
+
+        data = {name: column(name) for name in cls.fields}
+        for name in cls.optional_fields:
+            if all(getattr(point, name) is not None for point in points):
+                data[name] = column(name)
+        return cls(**data)
+
+    def __len__(self) -> int:
+        return len(self.V_in)
+
+    def __getitem__(self, index: int) -> DataPoint:
+        return DataPoint(**{
+            name: None if getattr(self, name) is None else getattr(self, name)[index]
+            for name in self.fields + self.optional_fields
+        })
+
+
 class Model:
     r"""
 
@@ -204,31 +468,153 @@ class Model:
     :type e_CA_in: typing.Optional[typing.Union[float, typing.List, typing.Tuple, typing.Generator, np.array]]
     :param e_CA_eq: error of adsorbent mass, defaults to last decimal point input from :attr:`.Model.CA_eq`
     :type e_CA_eq: typing.Optional[typing.Union[float, typing.List, typing.Tuple, typing.Generator, np.array]]
+    :param dtype: floating-point type used for all calculations, defaults to np.float64.
+        Measurement errors are far above single-precision resolution, so np.float32
+        halves the memory traffic of large datasets without losing physically
+        meaningful precision.
+    :type dtype: np.dtype, optional
+    :param backend: array backend used for all calculations, defaults to 'numpy'.
+        With 'cupy' the inputs are placed on the GPU and every evaluation runs
+        as CUDA kernels; the eval_* methods then return :class:`cupy.ndarray`
+        results, which ``.get()`` copies back to the host. Worthwhile for
+        datasets large enough to be limited by host memory bandwidth.
+    :type backend: str, optional
+
+    .. note::
+        The eval_* results are cached per instance, so the input arrays are
+        treated as immutable after construction; repeated calls inside
+        fitting or sweep loops return the stored arrays without recomputing.
 
     """
 
-    def __init__(self, **kwargs):
-        self.V_in: input_data = kwargs.pop('V_in')
-        self.d_in: input_data = kwargs.pop('d_in')
-        self.d_eq: input_data = kwargs.pop('d_eq')
-        self.m: input_data = kwargs.pop('m')
-        self.CA_in: input_data = kwargs.pop('CA_in')
-        self.CA_eq: input_data = kwargs.pop('CA_eq')
-        self.d_A: input_data = kwargs.pop('d_A', None)
-        self.d_S: input_data = kwargs.pop('d_S', None)
-        self.V_p: float = kwargs.pop('V_p', None)
-        self.V_units: str = kwargs.pop('V_units')
-        self.C_units: str = kwargs.pop('C_units')
-        self.m_units: str = kwargs.pop('m_units')
-        self.d_units: str = kwargs.pop('d_units')
-        self.e_V_in: error_data = kwargs.pop('e_V_in', None)
-        self.e_d_in: error_data = kwargs.pop('e_d_in', None)
-        self.e_d_eq: error_data = kwargs.pop('e_d_eq', None)
-        self.e_m: error_data = kwargs.pop('e_m', None)
-        self.e_CA_in: error_data = kwargs.pop('e_CA_in', None)
-
-        # todo: if errors are not provided, estimate from last decimal point of each input data
-        # todo: convert input datas into uncertainties types np.array([u.ufloat(1., 2.)...])
+    __slots__ = ('dtype', 'V_in', 'd_in', 'd_eq', 'm', 'CA_in', 'CA_eq',
+                 'd_A', 'd_S', 'V_p', 'V_units', 'C_units', 'm_units', 'd_units',
+                 '_e_V_in', '_e_d_in', '_e_d_eq', '_e_m', '_e_CA_in', '_e_CA_eq',
+                 'inv_Vin', 'inv_m', 'inv_CAeq', 'inv_dA', 'Vin_CAin', '_cache', '_scratch',
+                 '_eval_VC_impl', '_eval_PF_impl', 'xp', '_kernels')
+
+    def __init__(self, V_in, d_in, d_eq, m, CA_in, CA_eq, d_A=None, d_S=None, V_p=None,
+                 V_units='', C_units='', m_units='', d_units='',
+                 e_V_in=None, e_d_in=None, e_d_eq=None, e_m=None, e_CA_in=None, e_CA_eq=None,
+                 dtype=np.float64, backend='numpy'):
+        self.dtype: np.dtype = np.dtype(dtype)
+        self.xp = _array_module(backend)
+        xp = self.xp
+        self.V_in: np.ndarray = _as_float_array(V_in, dtype=self.dtype, xp=xp)
+        self.d_in: np.ndarray = _as_float_array(d_in, dtype=self.dtype, xp=xp)
+        self.d_eq: np.ndarray = _as_float_array(d_eq, dtype=self.dtype, xp=xp)
+        self.m: np.ndarray = _as_float_array(m, dtype=self.dtype, xp=xp)
+        self.CA_in: np.ndarray = _as_float_array(CA_in, dtype=self.dtype, xp=xp)
+        self.CA_eq: np.ndarray = _as_float_array(CA_eq, dtype=self.dtype, xp=xp)
+        self.d_A: error_data = _as_optional_float_array(d_A, dtype=self.dtype, xp=xp)
+        self.d_S: error_data = _as_optional_float_array(d_S, dtype=self.dtype, xp=xp)
+        self.V_p: error_data = _as_optional_float_array(V_p, dtype=self.dtype, xp=xp)
+        self.V_units: str = V_units
+        self.C_units: str = C_units
+        self.m_units: str = m_units
+        self.d_units: str = d_units
+        self._e_V_in: error_data = _as_optional_float_array(e_V_in, dtype=self.dtype, xp=xp)
+        self._e_d_in: error_data = _as_optional_float_array(e_d_in, dtype=self.dtype, xp=xp)
+        self._e_d_eq: error_data = _as_optional_float_array(e_d_eq, dtype=self.dtype, xp=xp)
+        self._e_m: error_data = _as_optional_float_array(e_m, dtype=self.dtype, xp=xp)
+        self._e_CA_in: error_data = _as_optional_float_array(e_CA_in, dtype=self.dtype, xp=xp)
+        self._e_CA_eq: error_data = _as_optional_float_array(e_CA_eq, dtype=self.dtype, xp=xp)
+        self._cache: typing.Dict = {}
+        self._scratch: typing.Optional[typing.Tuple] = None
+        # one divide each here replaces a divide per evaluation: a floating-point
+        # division costs several multiplies and pipelines poorly
+        self.inv_Vin: np.ndarray = np.reciprocal(self.V_in)
+        self.inv_m: np.ndarray = np.reciprocal(self.m)
+        self.inv_CAeq: np.ndarray = np.reciprocal(self.CA_eq)
+        self.inv_dA: error_data = None if self.d_A is None else np.reciprocal(self.d_A)
+        # shared by the NS and PF equilibrium-volume expressions
+        self.Vin_CAin: np.ndarray = self.V_in * self.CA_in
+        # validate the optional parameters once here instead of on every call:
+        # each eval dispatches straight to its specialized implementation
+        self._eval_VC_impl = self._eval_VC_fast if self.d_A is not None else self._eval_VC_missing
+        if self.d_A is not None and self.d_S is not None and self.V_p is not None:
+            self._eval_PF_impl = self._eval_PF_fast
+        else:
+            self._eval_PF_impl = self._eval_PF_missing
+        # the compiled kernels only accept host arrays; on the cupy backend the
+        # plain functions are called so the ufuncs dispatch to CUDA kernels
+        if xp is np:
+            self._kernels = kernels
+        else:
+            self._kernels = types.SimpleNamespace(**{
+                name: _raw_kernel(getattr(kernels, name))
+                for name in ('eval_XS_kernel', 'eval_NS_kernel',
+                             'eval_VC_kernel', 'eval_PF_kernel')})
+
+
+    @property
+    def e_V_in(self) -> np.ndarray:
+        r"""Error of the initial volume; estimated by :func:`._last_decimal_error` on first use if not given"""
+        if self._e_V_in is None:
+            self._e_V_in = _last_decimal_error(self.V_in)
+        return self._e_V_in
+
+    @property
+    def e_d_in(self) -> np.ndarray:
+        r"""Error of the initial density; estimated by :func:`._last_decimal_error` on first use if not given"""
+        if self._e_d_in is None:
+            self._e_d_in = _last_decimal_error(self.d_in)
+        return self._e_d_in
+
+    @property
+    def e_d_eq(self) -> np.ndarray:
+        r"""Error of the equilibrium density; estimated by :func:`._last_decimal_error` on first use if not given"""
+        if self._e_d_eq is None:
+            self._e_d_eq = _last_decimal_error(self.d_eq)
+        return self._e_d_eq
+
+    @property
+    def e_m(self) -> np.ndarray:
+        r"""Error of the adsorbent mass; estimated by :func:`._last_decimal_error` on first use if not given"""
+        if self._e_m is None:
+            self._e_m = _last_decimal_error(self.m)
+        return self._e_m
+
+    @property
+    def e_CA_in(self) -> np.ndarray:
+        r"""Error of the initial concentration; estimated by :func:`._last_decimal_error` on first use if not given"""
+        if self._e_CA_in is None:
+            self._e_CA_in = _last_decimal_error(self.CA_in)
+        return self._e_CA_in
+
+    @property
+    def e_CA_eq(self) -> np.ndarray:
+        r"""Error of the equilibrium concentration; estimated by :func:`._last_decimal_error` on first use if not given"""
+        if self._e_CA_eq is None:
+            self._e_CA_eq = _last_decimal_error(self.CA_eq)
+        return self._e_CA_eq
+
+    @classmethod
+    def from_batch(cls, batch: DataPointBatch, **kwargs) -> 'Model':
+        r"""Construct a model directly from a :class:`.DataPointBatch`
+
+        The batch arrays are adopted without copying, so the models evaluate
+        over the whole dataset in single vectorized passes.
+
+        :param batch: collected experimental data
+        :param kwargs: remaining key-word arguments (units, errors) passed through to the constructor
+        :return: model over the batched data
+        """
+        for name in batch.fields + batch.optional_fields:
+            kwargs.setdefault(name, getattr(batch, name))
+        return cls(**kwargs)
+
+    def _contiguous_inputs(self, *extra: np.ndarray) -> typing.Iterator:
+        r"""Broadcast the measured inputs (plus *extra*) to contiguous equal-size arrays
+
+        The compiled kernels in :mod:`callapy._model_kernel` iterate flat
+        float64 buffers, so every operand is expanded to the common shape.
+
+        :param extra: additional model parameters to pass through
+        :return: contiguous arrays in kernel argument order
+        """
+        inputs = (self.V_in, self.d_in, self.d_eq, self.m, self.CA_in, self.CA_eq) + extra
+        return (np.ascontiguousarray(a) for a in np.broadcast_arrays(*inputs))
 
     def eval_XS(self) -> typing.Tuple:
         r"""Excess adsorption model (XS)
@@ -238,9 +624,13 @@ class Model:
         :param kwargs: key-word arguments
         :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
         """
-        Q_A = self.V_in * (self.CA_in - self.CA_eq) / self.m
-        Q_S = self.V_in * ((self.d_in - self.d_eq) - (self.CA_in - self.CA_eq)) / self.m
-        return Q_A, Q_S, self.V_in
+        if 'XS' not in self._cache:
+            if _model_kernel is not None and self.dtype == np.float64 and self.xp is np:
+                self._cache['XS'] = _model_kernel.xs_eval(*self._contiguous_inputs())
+            else:
+                self._cache['XS'] = self._kernels.eval_XS_kernel(self.V_in, self.d_in, self.d_eq,
+                                                           self.CA_in, self.CA_eq, self.inv_m)
+        return self._cache['XS']
 
     def eval_NS(self) -> typing.Tuple:
         r"""No-solvent adsorption model (NS)
@@ -250,10 +640,14 @@ class Model:
         :param kwargs: key-word arguments
         :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
         """
-        Q_A = self.V_in * (self.d_in - self.CA_in / self.CA_eq * self.d_eq) / (1 - self.d_eq / self.CA_eq) / self.m
-        V_eq = (self.V_in * self.CA_in - self.m * Q_A) / self.CA_eq
-        Q_S = u.ufloat(0., 0.)  # todo: change form if more than one data point
-        return Q_A, Q_S, V_eq
+        if 'NS' not in self._cache:
+            if _model_kernel is not None and self.dtype == np.float64 and self.xp is np:
+                self._cache['NS'] = _model_kernel.ns_eval(*self._contiguous_inputs())
+            else:
+                self._cache['NS'] = self._kernels.eval_NS_kernel(self.V_in, self.d_in, self.d_eq, self.m,
+                                                           self.CA_in, self.CA_eq, self.inv_m,
+                                                           self.inv_CAeq, self.Vin_CAin)
+        return self._cache['NS']
 
     def eval_VC(self):
         r"""Volume change by solute adsorption model (VC)
@@ -264,10 +658,51 @@ class Model:
         :param kwargs: key-word arguments
         :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
         """
-        assert self.d_A is not None, 'Adsorbed density needed for VC method'
-        Q_A = self.V_in * (self.CA_in - self.CA_eq) / (self.m * (1 - self.CA_eq / self.d_A))
-        V_eq = self.V_in - self.m * Q_A / self.d_A
-        Q_S = (self.V_in * self.d_in - V_eq * self.d_eq - self.m * Q_A) / self.m
+        return self._eval_VC_impl()
+
+    def _eval_VC_fast(self):
+        if 'VC' not in self._cache:
+            if _model_kernel is not None and self.dtype == np.float64 and self.xp is np:
+                self._cache['VC'] = _model_kernel.vc_eval(*self._contiguous_inputs(self.d_A))
+            else:
+                self._cache['VC'] = self._kernels.eval_VC_kernel(self.V_in, self.d_in, self.d_eq, self.m,
+                                                           self.CA_in, self.CA_eq, self.inv_m,
+                                                           self.inv_dA)
+        return self._cache['VC']
+
+    def _eval_VC_missing(self):
+        raise ValueError('Adsorbed density needed for VC method')
+
+    def eval_VC_newton(self, tol: float = 1e-10, maxiter: int = 20) -> typing.Tuple:
+        r"""Volume change model solved by vectorized Newton iteration
+
+        Solves the solute mass balance, Equation :eq:`component_mb`, with the
+        VC closure :math:`V_\text{eq}=V_\text{in} - mQ_\text{A}/\rho_\text{A}`
+        as a root-finding problem in :math:`Q_\text{A}`. All N data points are
+        iterated simultaneously as ndarray operations rather than calling a
+        scalar solver in a Python loop, so extensions of the closure that make
+        the residual nonlinear (e.g. a composition-dependent
+        :math:`\rho_\text{A}`) stay vectorized. For the present linear
+        residual the iteration reproduces :meth:`.Model.eval_VC` in a single
+        step.
+
+        :param tol: residual tolerance for convergence, defaults to 1e-10
+        :param maxiter: maximum number of Newton steps, defaults to 20
+        :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
+        """
+        if self.d_A is None:
+            raise ValueError('Adsorbed density needed for VC method')
+        # start from the closed-form loading; one pass through the data per step
+        Q_A = self.V_in * (self.CA_in - self.CA_eq) / (1.0 - self.CA_eq * self.inv_dA) * self.inv_m
+        fprime = self.m * (self.CA_eq * self.inv_dA - 1.0)
+        for _ in range(maxiter):
+            V_eq = self.V_in - self.m * Q_A * self.inv_dA
+            residual = self.V_in * self.CA_in - V_eq * self.CA_eq - self.m * Q_A
+            if np.all(np.abs(residual) < tol):
+                break
+            Q_A = Q_A - residual / fprime
+        V_eq = self.V_in - self.m * Q_A * self.inv_dA
+        Q_S = (self.V_in * self.d_in - V_eq * self.d_eq - self.m * Q_A) * self.inv_m
         return Q_A, Q_S, V_eq
 
     def eval_PF(self):
@@ -281,12 +716,270 @@ class Model:
         :param kwargs: key-word arguments
         :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
         """
-        assert self.d_A is not None, 'Adsorbed density needed for PC'
-        assert self.V_p is not None, 'Pore volume needed for PF method'
-        assert self.d_S is not None, 'Adsorbed density needed for VC method'
-        Q_A = ((self.CA_in - (self.d_in / self.d_eq - self.V_p * self.d_S * self.m / (self.V_in * self.d_eq)) * self.CA_eq)
-              / (self.m / self.V_in * (1 + (self.d_S/self.d_A - 1) * self.CA_eq / self.d_eq)))
-        Q_S = (self.V_p - Q_A/self.d_A) * self.d_S
-        V_eq = (self.V_in * self.CA_in - self.m * Q_A) / self.CA_eq
+        return self._eval_PF_impl()
+
+    def _eval_PF_fast(self):
+        if 'PF' not in self._cache:
+            if _model_kernel is not None and self.dtype == np.float64 and self.xp is np:
+                self._cache['PF'] = _model_kernel.pf_eval(
+                    *self._contiguous_inputs(self.d_A, self.d_S, self.V_p))
+            else:
+                self._cache['PF'] = self._eval_PF_numpy()
+        return self._cache['PF']
+
+    def _eval_PF_missing(self):
+        missing = [name for name in ('d_A', 'd_S', 'V_p') if getattr(self, name) is None]
+        raise ValueError('PF method needs ' + ', '.join(missing))
+
+    def _scratch_buffers(self) -> typing.Tuple:
+        r"""Three reusable intermediate buffers of the common broadcast shape
+
+        Allocated on first use so models that never hit the NumPy fallback
+        path carry no extra memory.
+
+        :return: three uninitialized arrays of the broadcast input shape
+        """
+        if self._scratch is None:
+            # broadcast stride-0 dummies of the input shapes: passing the
+            # arrays themselves to np.broadcast would implicitly convert
+            # them to host arrays, which cupy forbids
+            shape = np.broadcast(*(np.broadcast_to(0.0, np.shape(a))
+                                   for a in (self.V_in, self.d_in, self.d_eq, self.m,
+                                             self.CA_in, self.CA_eq, self.d_A, self.d_S,
+                                             self.V_p))).shape
+            self._scratch = tuple(self.xp.empty(shape, dtype=self.dtype) for _ in range(3))
+        return self._scratch
+
+    def _eval_PF_numpy(self) -> typing.Tuple:
+        r"""Pore-filling model as ufunc calls into preallocated scratch buffers
+
+        Bare array operators allocate a full-size temporary per operation;
+        for large datasets those temporaries overflow cache and every pass
+        goes back to DRAM. Writing the intermediates into three reused
+        buffers via the ``out=`` ufunc interface keeps the working set
+        resident; only the three returned arrays are freshly allocated.
+
+        :return: (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
+        """
+        s0, s1, s2 = self._scratch_buffers()
+        np.multiply(self.d_in, self.CA_eq, out=s0)
+        np.multiply(self.CA_in, self.d_eq, out=s1)
+        np.subtract(s0, s1, out=s0)
+        np.multiply(self.V_in, s0, out=s0)
+        np.multiply(self.m, self.d_S, out=s1)
+        np.multiply(s1, self.V_p, out=s1)
+        np.multiply(s1, self.CA_eq, out=s1)
+        np.subtract(s0, s1, out=s0)
+        np.multiply(s0, self.d_A, out=s0)  # numerator of Q_A
+        np.subtract(self.CA_eq, self.d_eq, out=s1)
+        np.multiply(s1, self.d_A, out=s1)
+        np.multiply(self.d_S, self.CA_eq, out=s2)
+        np.subtract(s1, s2, out=s1)
+        np.multiply(s1, self.m, out=s1)  # denominator of Q_A
+        Q_A = np.divide(s0, s1)
+        np.multiply(Q_A, self.inv_dA, out=s2)
+        np.subtract(self.V_p, s2, out=s2)
+        Q_S = np.multiply(s2, self.d_S)
+        np.multiply(self.m, Q_A, out=s1)
+        np.subtract(self.Vin_CAin, s1, out=s1)
+        V_eq = np.multiply(s1, self.inv_CAeq)
         return Q_A, Q_S, V_eq
 
+    def eval_all(self) -> typing.Dict:
+        r"""Evaluate every applicable model over the dataset in one fused pass
+
+        Tabulating the models side-by-side through the individual eval_*
+        methods traverses the input arrays once per model. Here the
+        subexpressions the models share (:math:`C_\text{A,in}-C_\text{A,eq}`,
+        :math:`\rho_\text{in}-\rho_\text{eq}`,
+        :math:`C_\text{A,eq}-\rho_\text{eq}`, the scaled NS numerator) are
+        formed once and reused, cutting the memory traffic of a model
+        comparison roughly in half. The VC and PF entries are included only when the
+        estimated densities (and pore volume) they need were given.
+
+        :return: mapping of model name ('XS', 'NS', 'VC', 'PF') to
+            (:math:`Q_\text{A}`, :math:`Q_\text{S}`, :math:`V_\text{eq}`)
+        """
+        dC = self.CA_in - self.CA_eq
+        dD = self.d_in - self.d_eq
+        Vin_over_m = self.V_in * self.inv_m
+        dCd = self.CA_eq - self.d_eq
+        Q_A = Vin_over_m * dC
+        results = {'XS': (Q_A, Vin_over_m * (dD - dC), self.V_in)}
+        ns_num = self.V_in * (self.d_in * self.CA_eq - self.CA_in * self.d_eq)
+        Q_A = ns_num / dCd * self.inv_m
+        results['NS'] = (Q_A, 0.0 * Q_A, (self.Vin_CAin - self.m * Q_A) * self.inv_CAeq)
+        if self.d_A is not None:
+            Q_A = Vin_over_m * dC / (1.0 - self.CA_eq * self.inv_dA)
+            V_eq = self.V_in - self.m * Q_A * self.inv_dA
+            Q_S = (self.V_in * self.d_in - V_eq * self.d_eq - self.m * Q_A) * self.inv_m
+            results['VC'] = (Q_A, Q_S, V_eq)
+            if self.d_S is not None and self.V_p is not None:
+                den = self.m * (dCd * self.d_A - self.d_S * self.CA_eq)
+                Q_A = (ns_num - self.m * self.d_S * self.V_p * self.CA_eq) * self.d_A / den
+                results['PF'] = (Q_A, (self.V_p - Q_A * self.inv_dA) * self.d_S,
+                                 (self.Vin_CAin - self.m * Q_A) * self.inv_CAeq)
+        for name, result in results.items():
+            self._cache.setdefault(name, result)
+        return results
+
+    def _error_arrays(self) -> typing.Tuple:
+        r"""Collect measurement errors in the order of the measured inputs
+
+        :return: (:math:`e_{V_\text{in}}`, :math:`e_{\rho_\text{in}}`, :math:`e_{\rho_\text{eq}}`,
+            :math:`e_m`, :math:`e_{C_\text{A,in}}`, :math:`e_{C_\text{A,eq}}`)
+        """
+        return self.e_V_in, self.e_d_in, self.e_d_eq, self.e_m, self.e_CA_in, self.e_CA_eq
+
+    @staticmethod
+    def _propagate(partials: typing.Tuple, errors: typing.Tuple) -> np.ndarray:
+        r"""Propagate uncorrelated measurement errors through one output
+
+        .. math::
+            e_y = \sqrt{\sum_i \left(\frac{\partial y}{\partial x_i}\right)^2 e_{x_i}^2}
+
+        :param partials: partial derivatives of the output with respect to each measured input
+        :param errors: errors of each measured input, in the same order as *partials*
+        :return: error of the output
+        """
+        variance = sum(p * p * e * e for p, e in zip(partials, errors))
+        return np.sqrt(variance)
+
+    def propagate_XS(self) -> typing.Tuple:
+        r"""Propagate measurement errors through the XS model (see :meth:`.Model.eval_XS`)
+
+        The partial derivatives of Equations :eq:`XS_QA` and :eq:`XS_QS` with respect to the
+        measured inputs are evaluated analytically and combined with
+        :meth:`.Model._propagate` as vectorized ufuncs,
+        so no per-operation dependency tracking is performed.
+
+        :return: (:math:`e_{Q_\text{A}}`, :math:`e_{Q_\text{S}}`, :math:`e_{V_\text{eq}}`)
+        """
+        errors = self._error_arrays()
+        Q_A, Q_S, V_eq = self.eval_XS()
+        Vin_over_m = self.V_in * self.inv_m
+        zero = np.zeros_like(self.V_in)
+        e_Q_A = self._propagate(
+            (Q_A * self.inv_Vin, zero, zero, -Q_A * self.inv_m, Vin_over_m, -Vin_over_m), errors)
+        e_Q_S = self._propagate(
+            (Q_S * self.inv_Vin, Vin_over_m, -Vin_over_m, -Q_S * self.inv_m, -Vin_over_m, Vin_over_m), errors)
+        e_V_eq = errors[0] * np.ones_like(self.V_in)
+        return e_Q_A, e_Q_S, e_V_eq
+
+    def propagate_NS(self) -> typing.Tuple:
+        r"""Propagate measurement errors through the NS model (see :meth:`.Model.eval_NS`)
+
+        The partial derivatives of Equation :eq:`NS_QA` with respect to the measured inputs
+        are evaluated analytically; the equilibrium-volume partials follow from the solute
+        mass balance, Equation :eq:`component_mb`, by the chain rule.
+
+        :return: (:math:`e_{Q_\text{A}}`, :math:`e_{Q_\text{S}}`, :math:`e_{V_\text{eq}}`)
+        """
+        errors = self._error_arrays()
+        Q_A, Q_S, V_eq = self.eval_NS()
+        inv_CAeq = self.inv_CAeq
+        ratio = self.d_eq * inv_CAeq
+        den = self.m * (1.0 - ratio)
+        mQ_less_VC = self.m * Q_A - self.Vin_CAin
+        dQA = (
+            (self.d_in - self.CA_in * ratio) / den,  # V_in
+            self.V_in / den,  # d_in
+            mQ_less_VC * inv_CAeq / den,  # d_eq
+            -Q_A * self.inv_m,  # m
+            -self.V_in * ratio / den,  # CA_in
+            -self.d_eq * inv_CAeq ** 2 * mQ_less_VC / den,  # CA_eq
+        )
+        e_Q_A = self._propagate(dQA, errors)
+        e_Q_S = np.zeros_like(self.V_in)
+        dVeq = (
+            (self.CA_in - self.m * dQA[0]) * inv_CAeq,
+            -self.m * dQA[1] * inv_CAeq,
+            -self.m * dQA[2] * inv_CAeq,
+            (-Q_A - self.m * dQA[3]) * inv_CAeq,
+            (self.V_in - self.m * dQA[4]) * inv_CAeq,
+            -(self.m * dQA[5] + V_eq) * inv_CAeq,
+        )
+        e_V_eq = self._propagate(dVeq, errors)
+        return e_Q_A, e_Q_S, e_V_eq
+
+    def propagate_VC(self) -> typing.Tuple:
+        r"""Propagate measurement errors through the VC model (see :meth:`.Model.eval_VC`)
+
+        The partial derivatives of Equation :eq:`VC_QA` with respect to the measured inputs
+        are evaluated analytically; the equilibrium-volume and solvent-loading partials
+        follow from the mass balances, Equations :eq:`total_mb` and :eq:`component_mb`,
+        by the chain rule.
+
+        :return: (:math:`e_{Q_\text{A}}`, :math:`e_{Q_\text{S}}`, :math:`e_{V_\text{eq}}`)
+        """
+        errors = self._error_arrays()
+        Q_A, Q_S, V_eq = self.eval_VC()
+        inv_m = self.inv_m
+        den = self.m * (1.0 - self.CA_eq * self.inv_dA)
+        zero = np.zeros_like(self.V_in)
+        dQA = (
+            Q_A * self.inv_Vin,  # V_in
+            zero,  # d_in
+            zero,  # d_eq
+            -Q_A * inv_m,  # m
+            self.V_in / den,  # CA_in
+            (self.m * Q_A * self.inv_dA - self.V_in) / den,  # CA_eq
+        )
+        e_Q_A = self._propagate(dQA, errors)
+        dVeq = (
+            1.0 - self.m * dQA[0] * self.inv_dA,
+            zero,
+            zero,
+            (-Q_A - self.m * dQA[3]) * self.inv_dA,
+            -self.m * dQA[4] * self.inv_dA,
+            -self.m * dQA[5] * self.inv_dA,
+        )
+        e_V_eq = self._propagate(dVeq, errors)
+        dQS = (
+            (self.d_in - self.d_eq * dVeq[0]) * inv_m - dQA[0],
+            self.V_in * inv_m,
+            -V_eq * inv_m,
+            -Q_S * inv_m,
+            -self.d_eq * dVeq[4] * inv_m - dQA[4],
+            -self.d_eq * dVeq[5] * inv_m - dQA[5],
+        )
+        e_Q_S = self._propagate(dQS, errors)
+        return e_Q_A, e_Q_S, e_V_eq
+
+    def propagate_PF(self) -> typing.Tuple:
+        r"""Propagate measurement errors through the PF model (see :meth:`.Model.eval_PF`)
+
+        The partial derivatives of Equation :eq:`PF_QA` with respect to the measured inputs
+        are evaluated analytically; the solvent-loading partials are proportional to the
+        solute-loading partials through the pore-filling constraint, and the
+        equilibrium-volume partials follow from Equation :eq:`component_mb`.
+
+        :return: (:math:`e_{Q_\text{A}}`, :math:`e_{Q_\text{S}}`, :math:`e_{V_\text{eq}}`)
+        """
+        errors = self._error_arrays()
+        Q_A, Q_S, V_eq = self.eval_PF()
+        inv_CAeq = self.inv_CAeq
+        ratio = self.d_eq * inv_CAeq
+        den = self.m * (1.0 - ratio - self.d_S * self.inv_dA)
+        mQ_less_VC = self.m * Q_A - self.Vin_CAin
+        dQA = (
+            (self.d_in - self.CA_in * ratio) / den,  # V_in
+            self.V_in / den,  # d_in
+            mQ_less_VC * inv_CAeq / den,  # d_eq
+            -self.d_S * self.V_p / den - Q_A * self.inv_m,  # m
+            -self.V_in * ratio / den,  # CA_in
+            -self.d_eq * inv_CAeq ** 2 * mQ_less_VC / den,  # CA_eq
+        )
+        e_Q_A = self._propagate(dQA, errors)
+        e_Q_S = self.d_S * self.inv_dA * e_Q_A
+        dVeq = (
+            (self.CA_in - self.m * dQA[0]) * inv_CAeq,
+            -self.m * dQA[1] * inv_CAeq,
+            -self.m * dQA[2] * inv_CAeq,
+            (-Q_A - self.m * dQA[3]) * inv_CAeq,
+            (self.V_in - self.m * dQA[4]) * inv_CAeq,
+            -(self.m * dQA[5] + V_eq) * inv_CAeq,
+        )
+        e_V_eq = self._propagate(dVeq, errors)
+        return e_Q_A, e_Q_S, e_V_eq
+
@@ -3,6 +3,20 @@ import setuptools
 with open('README.md', 'r') as f:
     long_description = f.read()
 
+try:
+    import numpy
+    ext_modules = [
+        setuptools.Extension(
+            'callapy._model_kernel',
+            sources=['callapy/_model_kernel.c'],
+            include_dirs=[numpy.get_include()],
+            extra_compile_args=['-O3'],
+            optional=True,  # pure-Python install still works if the build fails
+        ),
+    ]
+except ImportError:
+    ext_modules = []
+
 setuptools.setup(
     name="callapy",
     version="0.0.2",
@@ -20,6 +34,17 @@ setuptools.setup(
         "Operating System :: OS Independent",
         "Topic :: Scientific/Engineering",
     ],
+    ext_modules=ext_modules,
     python_requires='>=3.6',
-    install_requires=["matplotlib==3.2.1", "numpy==1.18.4", "pandas==1.0.3", "Pint==0.11"]
+    # numpy is the only runtime dependency; everything else is opt-in so a
+    # plain install stays small and fast
+    install_requires=["numpy>=1.18"],
+    extras_require={
+        'plotting': ['matplotlib'],
+        'units': ['Pint'],
+        'io': ['pandas'],
+        'speed': ['numba'],
+        'gpu': ['cupy'],
+        'test': ['pytest', 'uncertainties'],
+    },
 )
@@ -1,9 +1,234 @@
-from callapy.model import Model
+import sys
+import types
+
+from callapy.model import DataPoint, DataPointBatch, Model
+import numpy as np
 import pytest
+import uncertainties as u
+
+
+example_kwargs = dict(
+    V_in=10., d_in=0.9982, d_eq=0.9953, m=1., CA_in=0.05, CA_eq=0.03,
+    d_A=0.8, d_S=0.997, V_p=0.3,
+    V_units='mL', C_units='g/mL', m_units='g', d_units='g/mL',
+)
 
 
 def test_model():
     with pytest.raises(Exception):
         I = Model()
 
-# todo: test that get same results with all floats vs all np arrays
+
+def test_floats_same_as_arrays():
+    """Same results with all floats vs all np arrays"""
+    scalar = Model(**example_kwargs)
+    arrays = Model(**{
+        key: np.array([val] * 3) if not isinstance(val, str) else val
+        for key, val in example_kwargs.items()
+    })
+    for method in 'eval_XS', 'eval_NS', 'eval_VC', 'eval_PF':
+        for result, results in zip(getattr(scalar, method)(), getattr(arrays, method)()):
+            assert np.allclose(results, result)
+
+
+example_errors = dict(
+    e_V_in=0.01, e_d_in=0.0001, e_d_eq=0.0001, e_m=0.0001, e_CA_in=0.0005, e_CA_eq=0.0005,
+)
+
+
+def test_propagation_matches_uncertainties_package():
+    """Analytic Jacobian propagation agrees with uncertainties' automatic tracking"""
+    model = Model(**example_kwargs, **example_errors)
+    V_in = u.ufloat(example_kwargs['V_in'], example_errors['e_V_in'])
+    d_in = u.ufloat(example_kwargs['d_in'], example_errors['e_d_in'])
+    d_eq = u.ufloat(example_kwargs['d_eq'], example_errors['e_d_eq'])
+    m = u.ufloat(example_kwargs['m'], example_errors['e_m'])
+    CA_in = u.ufloat(example_kwargs['CA_in'], example_errors['e_CA_in'])
+    CA_eq = u.ufloat(example_kwargs['CA_eq'], example_errors['e_CA_eq'])
+    d_A, d_S, V_p = example_kwargs['d_A'], example_kwargs['d_S'], example_kwargs['V_p']
+
+    Q_A = V_in * (CA_in - CA_eq) / m
+    Q_S = V_in * ((d_in - d_eq) - (CA_in - CA_eq)) / m
+    expected = {'XS': (Q_A, Q_S, V_in)}
+    Q_A = V_in * (d_in - CA_in / CA_eq * d_eq) / (1 - d_eq / CA_eq) / m
+    expected['NS'] = (Q_A, 0., (V_in * CA_in - m * Q_A) / CA_eq)
+    Q_A = V_in * (CA_in - CA_eq) / (m * (1 - CA_eq / d_A))
+    V_eq = V_in - m * Q_A / d_A
+    expected['VC'] = (Q_A, (V_in * d_in - V_eq * d_eq - m * Q_A) / m, V_eq)
+    Q_A = ((V_in * (d_in - CA_in / CA_eq * d_eq) - m * d_S * V_p)
+           / (m * (1 - d_eq / CA_eq - d_S / d_A)))
+    expected['PF'] = (Q_A, (V_p - Q_A / d_A) * d_S, (V_in * CA_in - m * Q_A) / CA_eq)
+
+    for name, values in expected.items():
+        errors = getattr(model, 'propagate_' + name)()
+        for value, error in zip(values, errors):
+            std_dev = value.std_dev if isinstance(value, u.UFloat) else 0.
+            assert np.allclose(error, std_dev)
+
+
+def test_batch_from_points_matches_scalar_models():
+    """A DataPointBatch gives the same loadings as per-point models"""
+    points = [
+        DataPoint(V_in=10. + i, d_in=0.9982, d_eq=0.9953, m=1. + 0.1 * i,
+                  CA_in=0.05, CA_eq=0.03 + 0.001 * i, d_A=0.8, d_S=0.997, V_p=0.3)
+        for i in range(4)
+    ]
+    batch = DataPointBatch.from_points(points)
+    assert len(batch) == len(points)
+    assert batch[2].V_in == points[2].V_in
+    units = dict(V_units='mL', C_units='g/mL', m_units='g', d_units='g/mL')
+    batched = Model.from_batch(batch, **units)
+    for method in 'eval_XS', 'eval_NS', 'eval_VC', 'eval_PF':
+        results = getattr(batched, method)()
+        for i, point in enumerate(points):
+            single = Model(**units, **{name: getattr(point, name) for name in DataPoint.__slots__})
+            for result, expected in zip(results, getattr(single, method)()):
+                assert np.allclose(np.asarray(result).ravel()[i] if np.ndim(result) else result, expected)
+
+
+def test_float32_dtype():
+    """float32 results agree with float64 to single precision"""
+    double = Model(**example_kwargs)
+    single = Model(dtype=np.float32, **example_kwargs)
+    for method in 'eval_XS', 'eval_NS', 'eval_VC', 'eval_PF':
+        for result32, result64 in zip(getattr(single, method)(), getattr(double, method)()):
+            assert np.asarray(result32).dtype == np.float32
+            assert np.allclose(result32, result64, rtol=1e-5)
+
+
+def test_memoization():
+    """Repeated evaluations are served from the caches"""
+    model = Model(**example_kwargs)
+    assert model.eval_PF() is model.eval_PF()
+    point = DataPoint(V_in=10., d_in=0.9982, d_eq=0.9953, m=1., CA_in=0.05, CA_eq=0.03)
+    twin = DataPoint(V_in=10., d_in=0.9982, d_eq=0.9953, m=1., CA_in=0.05, CA_eq=0.03)
+    assert point == twin and hash(point) == hash(twin)
+    assert point.eval_XS() is twin.eval_XS()
+    with pytest.raises(AttributeError):
+        point.V_in = 11.
+
+
+def test_newton_matches_closed_form_vc():
+    """The vectorized Newton solve reproduces the closed-form VC loadings"""
+    model = Model(**example_kwargs)
+    for newton, closed in zip(model.eval_VC_newton(), model.eval_VC()):
+        assert np.allclose(newton, closed)
+
+
+def test_default_errors_estimated_lazily():
+    """Errors default to one unit in the last reported digit and support propagation"""
+    model = Model(**example_kwargs)
+    assert model._e_m is None
+    assert np.allclose(model.e_m, 1e-3)
+    assert np.allclose(model.e_V_in, 1e-2)
+    for error in model.propagate_XS():
+        assert np.all(np.isfinite(error))
+
+
+def test_eval_all_matches_individual_models():
+    """The fused comparison pass reproduces each individual model"""
+    model = Model(**example_kwargs)
+    reference = Model(**example_kwargs)
+    results = model.eval_all()
+    assert set(results) == {'XS', 'NS', 'VC', 'PF'}
+    for name, values in results.items():
+        for value, expected in zip(values, getattr(reference, 'eval_' + name)()):
+            assert np.allclose(value, expected)
+    no_densities = Model(**{key: val for key, val in example_kwargs.items()
+                            if key not in ('d_A', 'd_S', 'V_p')})
+    assert set(no_densities.eval_all()) == {'XS', 'NS'}
+
+
+def test_pf_fallback_matches_compiled_kernel(monkeypatch):
+    """The buffered NumPy PF path agrees with the compiled kernel"""
+    import callapy.model as model_module
+    compiled = Model(**example_kwargs).eval_PF()
+    monkeypatch.setattr(model_module, '_model_kernel', None)
+    fallback = Model(**example_kwargs)
+    for result, expected in zip(fallback.eval_PF(), compiled):
+        assert np.allclose(result, expected)
+    # the scratch buffers are reused across fallback evaluations
+    assert fallback._scratch is not None
+
+
+def test_missing_parameters_raise():
+    """Models constructed without the estimated densities reject VC and PF"""
+    model = Model(**{key: val for key, val in example_kwargs.items()
+                     if key not in ('d_A', 'd_S', 'V_p')})
+    with pytest.raises(ValueError):
+        model.eval_VC()
+    with pytest.raises(ValueError):
+        model.eval_PF()
+
+
+def test_backend_selection():
+    """The default backend is numpy; unknown backends are rejected"""
+    model = Model(**example_kwargs, backend='numpy')
+    assert isinstance(model.eval_XS()[0], np.ndarray)
+    with pytest.raises(ValueError):
+        Model(**example_kwargs, backend='fortran')
+
+
+def test_float32_stable_near_equal_density_and_concentration():
+    """The reformulated NS and PF denominators stay accurate when d_eq is close to CA_eq"""
+    # inputs are pre-rounded to float32 so both models see identical values
+    # and the comparison isolates the arithmetic, not the input quantization
+    close_kwargs = {
+        key: np.float32(val) if not isinstance(val, str) else val
+        for key, val in dict(example_kwargs, CA_eq=0.9954, CA_in=0.5).items()
+    }
+    double = Model(**close_kwargs)
+    single = Model(dtype=np.float32, **close_kwargs)
+    for method in 'eval_NS', 'eval_PF':
+        for result32, result64 in zip(getattr(single, method)(), getattr(double, method)()):
+            assert np.allclose(result32, result64, rtol=1e-5)
+
+
+class _DeviceArray(np.lib.mixins.NDArrayOperatorsMixin):
+    """Minimal cupy-like array: ufuncs dispatch, implicit host conversion raises"""
+
+    def __init__(self, data):
+        self._data = np.asarray(data)
+
+    @property
+    def shape(self):
+        return self._data.shape
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    def __array__(self, *args, **kwargs):
+        raise TypeError('Implicit conversion to a NumPy array is not allowed')
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        def unwrap(value):
+            return value._data if isinstance(value, _DeviceArray) else value
+        if 'out' in kwargs:
+            kwargs['out'] = tuple(unwrap(value) for value in kwargs['out'])
+        result = getattr(ufunc, method)(*(unwrap(value) for value in inputs), **kwargs)
+        return _DeviceArray(result) if isinstance(result, np.ndarray) else result
+
+    def get(self):
+        return self._data
+
+
+_device_backend = types.SimpleNamespace(
+    asarray=lambda value, dtype=None: _DeviceArray(np.asarray(
+        value._data if isinstance(value, _DeviceArray) else value, dtype=dtype)),
+    atleast_1d=lambda value: _DeviceArray(np.atleast_1d(value._data)),
+    empty=lambda shape, dtype=None: _DeviceArray(np.empty(shape, dtype=dtype)),
+)
+
+
+def test_device_backend_never_converts_to_host(monkeypatch):
+    """Every model evaluates on a cupy-like backend that forbids host conversion"""
+    monkeypatch.setitem(sys.modules, 'cupy', _device_backend)
+    device = Model(**example_kwargs, backend='cupy')
+    reference = Model(**example_kwargs)
+    for method in 'eval_XS', 'eval_NS', 'eval_VC', 'eval_PF':
+        for result, expected in zip(getattr(device, method)(), getattr(reference, method)()):
+            assert isinstance(result, _DeviceArray)
+            assert np.allclose(result.get(), expected)
+    # the lazy default errors are also estimated without leaving the device
+    assert np.allclose(device.e_m.get(), reference.e_m)